@@ -1,634 +1,1015 @@
-import sys
-import os
-import zipfile
-import datetime
-import time
-import re
-from PyQt6 import QtWidgets, QtCore, QtGui
-import subprocess
-
-# Windows 전용 레지스트리 모듈
-if os.name == 'nt':
-    import winreg
-
-CURRENT_VERSION = "v1.0.0"  # 현재 버전
-
-# --------------------------- 유틸리티 함수 ---------------------------
-def format_size(size):
-    """바이트 단위의 파일 크기를 사람이 읽기 쉬운 형식으로 변환."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024:
-            return f"{size:.2f} {unit}"
-        size /= 1024
-    return f"{size:.2f} PB"
-
-def format_time(seconds):
-    """초 단위의 시간을 hh:mm:ss 형식으로 변환."""
-    return str(datetime.timedelta(seconds=int(seconds)))
-
-# --------------------------- 검색 작업 Worker ---------------------------
-class SearchWorker(QtCore.QObject):
-    progress = QtCore.pyqtSignal(int, int)  # (현재 진행, 총 파일 수)
-    finished = QtCore.pyqtSignal(list)        # 각 파일에 대해 (매칭 여부, 매칭된 줄들의 리스트 [(줄번호, 해당줄 텍스트), ...])
-
-    def __init__(self, files, search_term):
-        super().__init__()
-        self.files = files  # list of tuples (full_path, base_file_name)
-        self.search_term = search_term.lower()
-        self._cancelled = False
-
-    def cancel(self):
-        self._cancelled = True
-
-    def run(self):
-        results = []
-        total = len(self.files)
-        for i, (full_path, file_name) in enumerate(self.files):
-            if self._cancelled:
-                break
-            match = False
-            line_matches = []
-            # 파일명 검색
-            if self.search_term in file_name.lower():
-                match = True
-            # 파일 내용 검색 (텍스트 파일로 가정)
-            try:
-                with open(full_path, 'r', encoding='utf-8') as f:
-                    for num, line in enumerate(f, 1):
-                        if self._cancelled:
-                            break
-                        if self.search_term in line.lower():
-                            line_matches.append((num, line.rstrip()))
-                if line_matches:
-                    match = True
-            except Exception:
-                pass
-            results.append((match, line_matches))
-            self.progress.emit(i + 1, total)
-        self.finished.emit(results)
-
-# --------------------------- 압축 작업 Worker (멀티스레딩) ---------------------------
-class CompressionWorker(QtCore.QObject):
-    progress = QtCore.pyqtSignal(int, int)  # (현재 완료된 파일 수, 전체 파일 수)
-    finished = QtCore.pyqtSignal(str)         # 압축 파일 경로 전달
-    error = QtCore.pyqtSignal(str)
-
-    def __init__(self, files_to_compress, zip_path):
-        super().__init__()
-        self.files_to_compress = files_to_compress  # list of tuples (full_path, arcname)
-        self.zip_path = zip_path
-        self._cancelled = False
-
-    def cancel(self):
-        self._cancelled = True
-
-    def read_file(self, full_path, arcname):
-        if self._cancelled:
-            raise Exception("압축 작업이 취소되었습니다.")
-        try:
-            with open(full_path, "rb") as f:
-                data = f.read()
-            return (arcname, data)
-        except Exception as e:
-            raise Exception(f"파일 읽기 실패: {full_path} - {str(e)}")
-
-    def run(self):
-        total = len(self.files_to_compress)
-        results = []
-        try:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            with ThreadPoolExecutor() as executor:
-                futures = {executor.submit(self.read_file, full_path, arcname): (full_path, arcname) 
-                           for full_path, arcname in self.files_to_compress}
-                count = 0
-                for future in as_completed(futures):
-                    if self._cancelled:
-                        raise Exception("압축 작업이 취소되었습니다.")
-                    result = future.result()
-                    results.append(result)
-                    count += 1
-                    self.progress.emit(count, total)
-            if self._cancelled:
-                raise Exception("압축 작업이 취소되었습니다.")
-            with zipfile.ZipFile(self.zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for arcname, data in results:
-                    if self._cancelled:
-                        raise Exception("압축 작업이 취소되었습니다.")
-                    zipf.writestr(arcname, data)
-            self.finished.emit(self.zip_path)
-        except Exception as e:
-            self.error.emit(str(e))
-
-# --------------------------- 파일 삭제 Worker ---------------------------
-class DeletionWorker(QtCore.QObject):
-    progress = QtCore.pyqtSignal(int, int, float, float, float)
-    finished = QtCore.pyqtSignal()
-    error = QtCore.pyqtSignal(str)
-
-    def __init__(self, files_to_delete):
-        super().__init__()
-        self.files_to_delete = files_to_delete  # list of full_path
-        self._cancelled = False
-
-    def cancel(self):
-        self._cancelled = True
-
-    def run(self):
-        total = len(self.files_to_delete)
-        start_time = time.time()
-        for i, file_path in enumerate(self.files_to_delete):
-            if self._cancelled:
-                break
-            try:
-                os.remove(file_path)
-            except Exception as e:
-                self.error.emit(f"파일 삭제 오류: {file_path} - {str(e)}")
-                return
-            deleted = i + 1
-            elapsed = time.time() - start_time
-            percent = (deleted / total) * 100
-            avg = elapsed / deleted if deleted else 0
-            remaining = avg * (total - deleted)
-            self.progress.emit(deleted, total, percent, elapsed, remaining)
-        self.finished.emit()
-
-# --------------------------- 메인 윈도우 ---------------------------
-class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("카카오톡 파일 확인기")
-        self.resize(1000, 800)
-        self.setWindowIcon(QtGui.QIcon("./icon.png"))  # 프로그램 아이콘 적용
-
-        self.file_items = []  # 각 항목: (QTreeWidgetItem, full_path, base_file_name)
-        self.active_worker = None  # 현재 진행중인 작업의 worker 참조
-
-        central_widget = QtWidgets.QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QtWidgets.QVBoxLayout(central_widget)
-
-        # 상단 툴바: GitHub, 업데이트 확인 (텍스트만 사용)
-        toolbar = QtWidgets.QToolBar()
-        self.addToolBar(QtCore.Qt.ToolBarArea.TopToolBarArea, toolbar)
-        spacer = QtWidgets.QWidget()
-        spacer.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
-        toolbar.addWidget(spacer)
-        github_action = QtGui.QAction("GitHub", self)
-        github_action.triggered.connect(self.open_github)
-        toolbar.addAction(github_action)
-        update_action = QtGui.QAction("업데이트 확인", self)
-        update_action.triggered.connect(self.check_update)
-        toolbar.addAction(update_action)
-
-        # 검색 바: 검색 입력, 검색 버튼, 검색 초기화
-        search_layout = QtWidgets.QHBoxLayout()
-        self.search_input = QtWidgets.QLineEdit()
-        self.search_input.setPlaceholderText("파일명 또는 파일 내용 검색")
-        self.search_input.returnPressed.connect(self.start_search)
-        self.search_button = QtWidgets.QPushButton("검색")
-        self.search_button.clicked.connect(self.start_search)
-        self.search_reset_button = QtWidgets.QPushButton("검색 초기화")
-        self.search_reset_button.clicked.connect(self.reset_search)
-        search_layout.addWidget(self.search_input)
-        search_layout.addWidget(self.search_button)
-        search_layout.addWidget(self.search_reset_button)
-        main_layout.addLayout(search_layout)
-
-        # 진행바 및 상태 레이블 (검색/압축/삭제 진행 상황 표시)
-        self.progress_bar = QtWidgets.QProgressBar()
-        self.progress_bar.setVisible(False)
-        self.progress_label = QtWidgets.QLabel()
-        self.progress_label.setVisible(False)
-        main_layout.addWidget(self.progress_bar)
-        main_layout.addWidget(self.progress_label)
-
-        # 취소 버튼 (작업 진행 시 보임)
-        self.cancel_button = QtWidgets.QPushButton("취소")
-        self.cancel_button.setVisible(False)
-        self.cancel_button.clicked.connect(self.cancel_operation)
-        main_layout.addWidget(self.cancel_button)
-
-        # 파일 목록 QTreeWidget: 파일명, 확장자, 용량, 수정 날짜
-        self.tree = QtWidgets.QTreeWidget()
-        self.tree.setHeaderLabels(["파일명", "확장자", "용량", "수정 날짜"])
-        self.tree.setSortingEnabled(True)
-        self.tree.setColumnWidth(0, 400)  # 파일명 열 넓게
-        self.tree.itemDoubleClicked.connect(self.open_file)
-        main_layout.addWidget(self.tree)
-
-        # 하단 버튼 영역: 전체 선택, 전체 삭제, 선택 삭제, 열기, 압축하기, 새로고침
-        button_layout = QtWidgets.QHBoxLayout()
-        self.select_all_checkbox = QtWidgets.QCheckBox("전체 선택")
-        self.select_all_checkbox.stateChanged.connect(self.toggle_select_all)
-        self.btn_clear_all = QtWidgets.QPushButton("전체 삭제")
-        self.btn_clear_selected = QtWidgets.QPushButton("선택 삭제")
-        self.btn_open = QtWidgets.QPushButton("열기")
-        self.btn_compress = QtWidgets.QPushButton("압축하기")
-        self.btn_refresh = QtWidgets.QPushButton("새로고침")
-        button_layout.addWidget(self.select_all_checkbox)
-        button_layout.addWidget(self.btn_clear_all)
-        button_layout.addWidget(self.btn_clear_selected)
-        button_layout.addWidget(self.btn_open)
-        button_layout.addWidget(self.btn_compress)
-        button_layout.addWidget(self.btn_refresh)
-        button_layout.addStretch()
-        main_layout.addLayout(button_layout)
-
-        # 버튼 연결
-        self.btn_clear_all.clicked.connect(self.start_delete_all)
-        self.btn_clear_selected.clicked.connect(self.start_delete_selected)
-        self.btn_open.clicked.connect(self.open_selected_files)
-        self.btn_compress.clicked.connect(self.compress_files)
-        self.btn_refresh.clicked.connect(self.check_folder_and_list_files)
-
-        # 카카오톡 설치 및 파일 목록 로딩
-        self.check_kakaotalk_installation()
-        self.check_folder_and_list_files()
-
-    # --------------------------- 상단 액션 ---------------------------
-    def open_github(self):
-        import webbrowser
-        webbrowser.open("https://github.com/gaon12/talkcleaner")
-
-    def check_update(self):
-        """GitHub API를 통해 최신 릴리즈 버전을 확인하여 업데이트가 있으면 해당 페이지로 이동."""
-        import urllib.request, json, webbrowser
-        api_url = "https://api.github.com/repos/gaon12/talkcleaner/releases/latest"
-        try:
-            with urllib.request.urlopen(api_url, timeout=5) as response:
-                data = json.loads(response.read().decode())
-            latest_version = data.get("tag_name", "")
-            if latest_version and latest_version != CURRENT_VERSION:
-                reply = QtWidgets.QMessageBox.question(
-                    self, "업데이트 확인",
-                    f"최신 버전은 {latest_version}입니다. 업데이트 페이지로 이동할까요?",
-                    QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
-                )
-                if reply == QtWidgets.QMessageBox.StandardButton.Yes:
-                    webbrowser.open(data.get("html_url", ""))
-            else:
-                QtWidgets.QMessageBox.information(self, "업데이트 확인", "현재 최신 버전입니다.")
-        except Exception:
-            QtWidgets.QMessageBox.warning(self, "업데이트 확인", "업데이트 확인을 할 수 없습니다. 인터넷 연결을 확인해 주세요!")
-
-    def check_kakaotalk_installation(self):
-        """카카오톡 설치 여부를 exe 경로와 레지스트리로 확인."""
-        possible_paths = [
-            r"C:\Program Files\Kakao\KakaoTalk\KakaoTalk.exe",
-            r"C:\Program Files (x86)\Kakao\KakaoTalk\KakaoTalk.exe"
-        ]
-        installed_exe = any(os.path.exists(path) for path in possible_paths)
-        installed_reg = False
-        if os.name == 'nt':
-            reg_paths = [r"SOFTWARE\Kakao\KakaoTalk", r"SOFTWARE\WOW6432Node\Kakao\KakaoTalk"]
-            for reg_path in reg_paths:
-                try:
-                    key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path)
-                    winreg.CloseKey(key)
-                    installed_reg = True
-                    break
-                except FileNotFoundError:
-                    continue
-        if not (installed_exe or installed_reg):
-            QtWidgets.QMessageBox.warning(
-                self, "카카오톡 미설치", "카카오톡이 설치되어 있지 않습니다.",
-                QtWidgets.QMessageBox.StandardButton.Ok
-            )
-
-    def check_folder_and_list_files(self):
-        """'카카오톡 받은 파일' 폴더의 파일 목록(파일명, 확장자, 용량, 수정 날짜)을 로딩."""
-        self.tree.clear()
-        self.file_items.clear()
-        folder_path = os.path.join(os.environ['USERPROFILE'], 'Documents', '카카오톡 받은 파일')
-        if not os.path.isdir(folder_path):
-            QtWidgets.QMessageBox.warning(
-                self, "폴더 미존재", f"폴더가 존재하지 않습니다:\n{folder_path}",
-                QtWidgets.QMessageBox.StandardButton.Ok
-            )
-            return
-        for root, dirs, files in os.walk(folder_path):
-            relative_path = os.path.relpath(root, folder_path)
-            for file in files:
-                display_text = file if relative_path == '.' else os.path.join(relative_path, file)
-                full_path = os.path.join(root, file)
-                _, ext = os.path.splitext(file)
-                try:
-                    size = os.path.getsize(full_path)
-                    size_str = format_size(size)
-                except Exception:
-                    size_str = "N/A"
-                try:
-                    mod_time = os.path.getmtime(full_path)
-                    mod_time_str = datetime.datetime.fromtimestamp(mod_time).strftime("%Y-%m-%d %H:%M:%S")
-                except Exception:
-                    mod_time_str = "N/A"
-                item = QtWidgets.QTreeWidgetItem(self.tree)
-                item.setText(0, display_text)
-                item.setText(1, ext)
-                item.setText(2, size_str)
-                item.setText(3, mod_time_str)
-                # 체크박스 추가
-                item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
-                item.setCheckState(0, QtCore.Qt.CheckState.Unchecked)
-                self.file_items.append((item, full_path, os.path.basename(file)))
-        self.tree.expandAll()
-
-    # --------------------------- 파일 열기 기능 ---------------------------
-    def open_selected_files(self):
-        """체크된 파일 열기."""
-        for item, full_path, base_name in self.file_items:
-            if item.checkState(0) == QtCore.Qt.CheckState.Checked:
-                self.open_path(full_path)
-
-    def open_file(self, item, column):
-        """파일 항목 더블클릭 시 열기.
-           자식 항목(검색 결과 줄)인 경우, 저장된 (파일경로, 줄번호) 정보를 확인하여
-           Notepad++가 설치되어 있으면 해당 줄로 이동하여 열고, 그렇지 않으면 기본 연결 프로그램으로 파일만 엽니다."""
-        data = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-        if data is not None:
-            # 자식 항목인 경우 (검색 결과 줄)
-            self.open_file_at_line(data[0], data[1])
-        else:
-            # 상위 항목이면 해당 파일 열기
-            for it, full_path, base_name in self.file_items:
-                if it == item:
-                    self.open_path(full_path)
-                    break
-
-    def open_file_at_line(self, path, line):
-        """
-        Notepad++가 설치되어 있으면 해당 줄 번호로 열도록 시도.
-        (Notepad++가 기본 연결 프로그램이 아닐 경우에도, 특정 줄 이동을 지원하므로)
-        만약 Notepad++가 없으면 기본 연결 프로그램으로 파일만 열게 됩니다.
-        """
-        if os.name == 'nt':
-            notepadpp = r"C:\Program Files\Notepad++\notepad++.exe"
-            if os.path.exists(notepadpp):
-                try:
-                    subprocess.Popen([notepadpp, f"-n{line}", path])
-                except Exception as e:
-                    QtWidgets.QMessageBox.warning(self, "파일 열기", f"Notepad++로 열지 못했습니다:\n{str(e)}\n기본 프로그램으로 열겠습니다.")
-                    os.startfile(path)
-            else:
-                os.startfile(path)
-        else:
-            QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(path))
-
-    def open_path(self, path):
-        """운영체제 기본 프로그램으로 파일 열기."""
-        try:
-            if os.name == 'nt':
-                os.startfile(path)
-            else:
-                QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(path))
-        except Exception as e:
-            QtWidgets.QMessageBox.warning(self, "파일 열기", f"파일을 열 수 없습니다:\n{str(e)}")
-
-    # --------------------------- 전체 선택 체크박스 ---------------------------
-    def toggle_select_all(self, state):
-        check_state = QtCore.Qt.CheckState.Checked if state == QtCore.Qt.CheckState.Checked else QtCore.Qt.CheckState.Unchecked
-        for item, full_path, base_name in self.file_items:
-            item.setCheckState(0, check_state)
-
-    # --------------------------- 검색 기능 ---------------------------
-    def start_search(self):
-        """검색어를 이용해 파일명 및 파일 내용 검색 실행."""
-        search_term = self.search_input.text().strip()
-        if search_term == "":
-            self.reset_search()
-            return
-        files_for_search = [(full_path, base_name) for (item, full_path, base_name) in self.file_items]
-        self.search_button.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_label.setVisible(True)
-        self.cancel_button.setVisible(True)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setMaximum(len(files_for_search))
-        self.progress_label.setText("검색 진행중...")
-        self.search_thread = QtCore.QThread()
-        self.search_worker = SearchWorker(files_for_search, search_term)
-        self.active_worker = self.search_worker  # 현재 작업 설정
-        self.search_worker.moveToThread(self.search_thread)
-        self.search_worker.progress.connect(self.update_progress)
-        self.search_worker.finished.connect(self.search_finished)
-        self.search_thread.started.connect(self.search_worker.run)
-        self.search_thread.start()
-
-    def update_progress(self, value, total):
-        self.progress_bar.setValue(value)
-
-    def search_finished(self, results):
-        max_length = 35  # 최대 표시할 글자 수 제한
-        pattern = re.compile(re.escape(self.search_input.text().strip()), re.IGNORECASE)
-        for i, (item, full_path, base_name) in enumerate(self.file_items):
-            match, line_matches = results[i] if i < len(results) else (False, [])
-            item.takeChildren()  # 기존 자식 제거
-            item.setHidden(not match)
-            if match and line_matches:
-                for ln, line_text in line_matches:
-                    if len(line_text) > max_length:
-                        line_text = line_text[:max_length] + "..."
-                    highlighted = pattern.sub(lambda m: f"<b>{m.group()}</b>", line_text)
-                    child = QtWidgets.QTreeWidgetItem(item)
-                    child.setText(0, f"라인 {ln}: {highlighted}")
-                    child.setData(0, QtCore.Qt.ItemDataRole.UserRole, (full_path, ln))
-        self.progress_bar.setVisible(False)
-        self.progress_label.setVisible(False)
-        self.cancel_button.setVisible(False)
-        self.search_button.setEnabled(True)
-        self.search_thread.quit()
-        self.search_thread.wait()
-        self.search_worker.deleteLater()
-        self.search_thread.deleteLater()
-        self.active_worker = None
-
-    def reset_search(self):
-        """검색어 초기화 및 모든 파일 항목 표시, 자식 항목 제거."""
-        self.search_input.clear()
-        for item, full_path, base_name in self.file_items:
-            item.setHidden(False)
-            item.takeChildren()
-
-    # --------------------------- 압축 기능 ---------------------------
-    def compress_files(self):
-        """체크된 파일이 있으면 해당 파일 압축, 없으면 전체 파일 압축 여부 확인 후 진행."""
-        checked_files = [(full_path, item.text(0)) for item, full_path, base_name in self.file_items
-                         if item.checkState(0) == QtCore.Qt.CheckState.Checked and not item.isHidden()]
-        if not checked_files:
-            reply = QtWidgets.QMessageBox.question(
-                self, "압축하기", "체크된 파일이 없습니다. 전체 파일을 압축하시겠습니까?",
-                QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
-            )
-            if reply == QtWidgets.QMessageBox.StandardButton.Yes:
-                files_to_compress = [(full_path, item.text(0)) for item, full_path, base_name in self.file_items if not item.isHidden()]
-            else:
-                return
-        else:
-            files_to_compress = checked_files
-        if not files_to_compress:
-            QtWidgets.QMessageBox.information(self, "압축하기", "압축할 파일이 없습니다.")
-            return
-        zip_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "압축 파일 저장",
-            os.path.join(os.environ['USERPROFILE'], 'Desktop', f"kakaotalk_file_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"),
-            "Zip Files (*.zip)"
-        )
-        if not zip_path:
-            return
-        self.progress_bar.setVisible(True)
-        self.progress_label.setVisible(True)
-        self.cancel_button.setVisible(True)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setMaximum(len(files_to_compress))
-        self.progress_label.setText("압축 진행중...")
-        self.btn_compress.setEnabled(False)
-        self.comp_thread = QtCore.QThread()
-        self.comp_worker = CompressionWorker(files_to_compress, zip_path)
-        self.active_worker = self.comp_worker  # 현재 작업 설정
-        self.comp_worker.moveToThread(self.comp_thread)
-        self.comp_worker.progress.connect(self.update_progress)
-        self.comp_worker.finished.connect(self.compression_finished)
-        self.comp_worker.error.connect(self.compression_error)
-        self.comp_thread.started.connect(self.comp_worker.run)
-        self.comp_thread.start()
-
-    def compression_finished(self, zip_path):
-        self.progress_bar.setVisible(False)
-        self.progress_label.setVisible(False)
-        self.cancel_button.setVisible(False)
-        self.btn_compress.setEnabled(True)
-        self.comp_thread.quit()
-        self.comp_thread.wait()
-        self.comp_worker.deleteLater()
-        self.comp_thread.deleteLater()
-        self.active_worker = None
-        msg_box = QtWidgets.QMessageBox(self)
-        msg_box.setWindowTitle("압축 완료")
-        msg_box.setText(f"압축이 완료되었습니다:\n{zip_path}")
-        open_button = msg_box.addButton("열기", QtWidgets.QMessageBox.ButtonRole.AcceptRole)
-        close_button = msg_box.addButton("닫기", QtWidgets.QMessageBox.ButtonRole.RejectRole)
-        msg_box.exec()
-        if msg_box.clickedButton() == open_button:
-            self.open_path(zip_path)
-
-    def compression_error(self, err_msg):
-        self.progress_bar.setVisible(False)
-        self.progress_label.setVisible(False)
-        self.cancel_button.setVisible(False)
-        self.btn_compress.setEnabled(True)
-        QtWidgets.QMessageBox.warning(self, "압축하기", f"압축 중 오류 발생:\n{err_msg}")
-        self.comp_thread.quit()
-        self.comp_thread.wait()
-        self.comp_worker.deleteLater()
-        self.comp_thread.deleteLater()
-        self.active_worker = None
-
-    # --------------------------- 파일 삭제 기능 ---------------------------
-    def start_delete_all(self):
-        """전체 파일 삭제 전 경고 후 실제 삭제 진행."""
-        files_to_delete = [full_path for item, full_path, base_name in self.file_items if not item.isHidden()]
-        if not files_to_delete:
-            QtWidgets.QMessageBox.information(self, "삭제", "삭제할 파일이 없습니다.")
-            return
-        reply = QtWidgets.QMessageBox.question(
-            self, "전체 삭제", "정말로 전체 파일을 삭제하시겠습니까?\n(이 작업은 복구할 수 없습니다.)",
-            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
-        )
-        if reply != QtWidgets.QMessageBox.StandardButton.Yes:
-            return
-        self.start_deletion(files_to_delete)
-
-    def start_delete_selected(self):
-        """선택된 파일 삭제 전 경고 후 실제 삭제 진행."""
-        files_to_delete = [full_path for item, full_path, base_name in self.file_items if item.checkState(0) == QtCore.Qt.CheckState.Checked]
-        if not files_to_delete:
-            QtWidgets.QMessageBox.information(self, "삭제", "선택된 파일이 없습니다.")
-            return
-        reply = QtWidgets.QMessageBox.question(
-            self, "선택 삭제", "정말로 선택된 파일을 삭제하시겠습니까?\n(이 작업은 복구할 수 없습니다.)",
-            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
-        )
-        if reply != QtWidgets.QMessageBox.StandardButton.Yes:
-            return
-        self.start_deletion(files_to_delete)
-
-    def start_deletion(self, files_to_delete):
-        """DeletionWorker를 사용하여 파일 삭제 진행 및 진행률, 예상 시간 등을 표시."""
-        self.progress_bar.setVisible(True)
-        self.progress_label.setVisible(True)
-        self.cancel_button.setVisible(True)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setMaximum(len(files_to_delete))
-        self.progress_label.setText("삭제 진행중...")
-        self.btn_clear_all.setEnabled(False)
-        self.btn_clear_selected.setEnabled(False)
-        self.del_thread = QtCore.QThread()
-        self.del_worker = DeletionWorker(files_to_delete)
-        self.active_worker = self.del_worker  # 현재 작업 설정
-        self.del_worker.moveToThread(self.del_thread)
-        self.del_worker.progress.connect(self.update_deletion_progress)
-        self.del_worker.finished.connect(self.deletion_finished)
-        self.del_worker.error.connect(self.deletion_error)
-        self.del_thread.started.connect(self.del_worker.run)
-        self.del_thread.start()
-
-    def update_deletion_progress(self, deleted, total, percent, elapsed, remaining):
-        self.progress_bar.setValue(deleted)
-        self.progress_label.setText(f"삭제: {deleted}/{total}  {percent:.1f}%\n경과: {format_time(elapsed)} / 예상남은: {format_time(remaining)}")
-
-    def deletion_finished(self):
-        self.progress_bar.setVisible(False)
-        self.progress_label.setVisible(False)
-        self.cancel_button.setVisible(False)
-        self.btn_clear_all.setEnabled(True)
-        self.btn_clear_selected.setEnabled(True)
-        self.del_thread.quit()
-        self.del_thread.wait()
-        self.del_worker.deleteLater()
-        self.del_thread.deleteLater()
-        self.active_worker = None
-        QtWidgets.QMessageBox.information(self, "삭제 완료", "파일 삭제가 완료되었습니다.")
-        self.check_folder_and_list_files()
-
-    def deletion_error(self, err_msg):
-        self.progress_bar.setVisible(False)
-        self.progress_label.setVisible(False)
-        self.cancel_button.setVisible(False)
-        self.btn_clear_all.setEnabled(True)
-        self.btn_clear_selected.setEnabled(True)
-        QtWidgets.QMessageBox.warning(self, "삭제 오류", err_msg)
-        self.del_thread.quit()
-        self.del_thread.wait()
-        self.del_worker.deleteLater()
-        self.del_thread.deleteLater()
-        self.active_worker = None
-
-    # --------------------------- 취소 버튼 기능 ---------------------------
-    def cancel_operation(self):
-        """현재 진행중인 작업 취소."""
-        if self.active_worker is not None:
-            self.active_worker.cancel()
-            QtWidgets.QMessageBox.information(self, "취소", "작업이 취소되었습니다.")
-            self.cancel_button.setVisible(False)
-
-    # --------------------------- main() ---------------------------
-    def main(self):
-        from PyQt6.QtGui import QGuiApplication
-        QGuiApplication.setHighDpiScaleFactorRoundingPolicy(QtCore.Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
-        app = QtWidgets.QApplication(sys.argv)
-        app.setStyle("Fusion")
-        window = MainWindow()
-        window.show()
-        sys.exit(app.exec())
-
-def main():
-    from PyQt6.QtGui import QGuiApplication
-    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(QtCore.Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
-    app = QtWidgets.QApplication(sys.argv)
-    app.setStyle("Fusion")
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec())
-
-if __name__ == "__main__":
-    main()
+import sys
+import os
+import zipfile
+import datetime
+import time
+import html
+import threading
+import re
+import queue
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PyQt6 import QtWidgets, QtCore, QtGui
+import subprocess
+
+# 선택적 하이퍼스캔 (pip install hyperscan): 검색을 컴파일된 DFA로 수행하여
+# 큰 입력에서 bytes.find보다 수 배 빠름. 없으면 bytes.find로 동작.
+try:
+    import hyperscan as _hyperscan
+except ImportError:
+    _hyperscan = None
+
+# 선택적 가속 zlib (pip install isal 또는 zlib-ng): DEFLATE가 3~5배 빠르고
+# GIL을 해제하므로 압축 스레드가 실제로 여러 코어를 사용함. 없으면 표준 zlib 사용.
+try:
+    from isal import isal_zlib as _zlib
+except ImportError:
+    try:
+        from zlib_ng import zlib_ng as _zlib
+    except ImportError:
+        import zlib as _zlib
+zipfile.zlib = _zlib  # zipfile 내부 compressobj/crc32가 가속 구현을 쓰도록 교체
+
+# Windows 전용 레지스트리 모듈
+if os.name == 'nt':
+    import winreg
+
+# 선택적 pywin32 (pip install pywin32): 삭제를 셸 API 한 번으로 배치 처리(휴지통 경유)
+_win_shell = _win_shellcon = None
+if os.name == 'nt':
+    try:
+        from win32com.shell import shell as _win_shell, shellcon as _win_shellcon
+    except ImportError:
+        pass
+
+CURRENT_VERSION = "v1.0.0"  # 현재 버전
+
+MOD_TIME_FMT = "%Y-%m-%d %H:%M:%S"  # 파일 목록의 수정 날짜 표시 형식
+
+# 업데이트 확인 결과 캐시 (네트워크 왕복 절약)
+UPDATE_CACHE_PATH = os.path.expanduser('~/.talkcleaner_update.json')
+UPDATE_CACHE_TTL = 6 * 3600  # 초
+
+# --------------------------- 유틸리티 함수 ---------------------------
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+def format_size(size):
+    """바이트 단위의 파일 크기를 사람이 읽기 쉬운 형식으로 변환.
+    bit_length로 단위를 바로 고르므로 나눗셈 루프 없이 O(1)."""
+    if size <= 0:
+        return "0.00 B"
+    exp = min(len(SIZE_UNITS) - 1, (int(size).bit_length() - 1) // 10)
+    return f"{size / (1 << (10 * exp)):.2f} {SIZE_UNITS[exp]}"
+
+def format_time(seconds):
+    """초 단위의 시간을 hh:mm:ss 형식으로 변환."""
+    return str(datetime.timedelta(seconds=int(seconds)))
+
+@functools.lru_cache(maxsize=1)
+def kakaotalk_installed():
+    """카카오톡 설치 여부를 exe 경로와 레지스트리로 확인. 결과는 프로세스 동안 캐시."""
+    possible_paths = [
+        r"C:\Program Files\Kakao\KakaoTalk\KakaoTalk.exe",
+        r"C:\Program Files (x86)\Kakao\KakaoTalk\KakaoTalk.exe"
+    ]
+    if any(os.path.exists(path) for path in possible_paths):
+        return True
+    if os.name == 'nt':
+        reg_paths = [r"SOFTWARE\Kakao\KakaoTalk", r"SOFTWARE\WOW6432Node\Kakao\KakaoTalk"]
+        for reg_path in reg_paths:
+            try:
+                key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, reg_path)
+                winreg.CloseKey(key)
+                return True
+            except FileNotFoundError:
+                continue
+    return False
+
+def walk_files(path, _rel=''):
+    """os.scandir 기반 재귀 순회: (전체경로, 상대표시경로, stat 결과) 생성.
+    DirEntry.stat()은 scandir가 캐시한 값을 쓰므로 파일당 stat 호출이 한 번임.
+    stat에 실패한 항목은 None을 반환하고, 읽을 수 없는 디렉터리는 건너뜀."""
+    try:
+        entries = os.scandir(path)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            rel = os.path.join(_rel, entry.name) if _rel else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                is_dir = False
+            if is_dir:
+                yield from walk_files(entry.path, rel)
+            else:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    st = None
+                yield entry.path, rel, st
+
+# --------------------------- Worker 실행 어댑터 ---------------------------
+class WorkerRunnable(QtCore.QRunnable):
+    """전역 QThreadPool에서 worker의 run()을 실행하는 어댑터.
+    작업마다 QThread를 만들고 moveToThread/quit/wait/deleteLater로 정리하는
+    비용과 누수 가능성을 없앰. worker 시그널은 큐드 커넥션으로 메인 스레드에 전달됨."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self._fn = fn
+
+    def run(self):
+        self._fn()
+
+# --------------------------- 검색 작업 Worker ---------------------------
+class SearchWorker(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int, int)  # (현재 진행, 총 파일 수)
+    finished = QtCore.pyqtSignal(list)        # 각 파일에 대해 (매칭 여부, 매칭된 줄들의 리스트 [(줄번호, 해당줄 텍스트), ...])
+
+    CHUNK_SIZE = 1 << 20  # 1 MiB 단위로 파일을 읽음
+    MAX_SCAN_SIZE = 64 << 20  # 이보다 큰 파일은 내용 스캔 생략
+    # 내용 검색이 무의미한 바이너리 확장자 (파일명 검색은 그대로 수행)
+    SKIP_EXTS = frozenset({
+        '.jpg', '.jpeg', '.png', '.gif', '.webp',
+        '.mp4', '.mov', '.mkv', '.mp3', '.m4a',
+        '.zip', '.7z', '.pdf',
+    })
+
+    def __init__(self, files, search_term):
+        super().__init__()
+        self.files = files  # list of tuples (full_path, base_file_name, st_size)
+        self.search_term = search_term.lower()
+        self._needle = self.search_term.encode('utf-8')
+        self._hs_db = None
+        self._hs_local = threading.local()  # 스레드별 hyperscan 스크래치 보관
+        if _hyperscan is not None and self._needle:
+            try:
+                db = _hyperscan.Database()
+                db.compile(expressions=[re.escape(self._needle)],
+                           flags=[_hyperscan.HS_FLAG_CASELESS])
+                self._hs_db = db
+            except Exception:
+                self._hs_db = None
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def _collect_line_matches(self, buf, low, line_base, line_matches):
+        """소문자화된 버퍼(low)에서 검색어 위치를 찾아 (줄번호, 줄텍스트)를 수집."""
+        pos = 0
+        last_line_no = line_matches[-1][0] if line_matches else 0
+        while True:
+            idx = low.find(self._needle, pos)
+            if idx == -1:
+                break
+            line_no = line_base + low.count(b'\n', 0, idx) + 1
+            if line_no != last_line_no:
+                line_start = buf.rfind(b'\n', 0, idx) + 1
+                line_end = buf.find(b'\n', idx)
+                if line_end == -1:
+                    line_end = len(buf)
+                line_text = buf[line_start:line_end].decode('utf-8', errors='replace').rstrip()
+                line_matches.append((line_no, line_text))
+                last_line_no = line_no
+            pos = idx + 1
+
+    def _contains_needle(self, buf):
+        """버퍼에 검색어가 있는지 검사. hyperscan DFA가 있으면 DFA로, 없으면 bytes.find."""
+        if self._hs_db is not None:
+            # 스크래치는 동시 사용이 불가하므로 스캔 스레드마다 하나씩 만들어 씀
+            scratch = getattr(self._hs_local, 'scratch', None)
+            if scratch is None:
+                try:
+                    scratch = _hyperscan.Scratch(self._hs_db)
+                    self._hs_local.scratch = scratch
+                except Exception:
+                    return buf.lower().find(self._needle) != -1
+            found = False
+            def on_match(pat_id, start, end, flags, ctx):
+                nonlocal found
+                found = True
+                return 1  # 첫 매치에서 스캔 종료
+            try:
+                self._hs_db.scan(buf, match_event_handler=on_match, scratch=scratch)
+                return found
+            except Exception:
+                if found:
+                    return True
+        return buf.lower().find(self._needle) != -1
+
+    def _scan_one(self, full_path, file_name, st_size):
+        """파일 하나를 검사하여 (매칭 여부, 매칭된 줄 리스트)를 반환."""
+        # 파일명 검색
+        match = self.search_term in file_name.lower()
+        line_matches = []
+        # 내용 스캔 대상 선별: 바이너리 확장자·초대형 파일은 읽지 않음
+        # (크기는 폴더 목록 로딩 때 캐시한 stat 값을 사용하므로 재-stat 없음)
+        scan_content = (os.path.splitext(file_name)[1].lower() not in self.SKIP_EXTS
+                        and st_size is not None and st_size <= self.MAX_SCAN_SIZE)
+        if not scan_content:
+            return match, line_matches
+        # 파일 내용 검색: 텍스트 디코딩 대신 바이너리 청크 단위로 스캔
+        try:
+            with open(full_path, 'rb') as f:
+                carry = b''          # 이전 청크의 마지막 미완성 줄
+                line_base = 0        # 지금까지 처리한 줄(개행) 수
+                first_chunk = True
+                while True:
+                    if self._cancelled:
+                        break
+                    chunk = f.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        if carry and self._contains_needle(carry):
+                            self._collect_line_matches(carry, carry.lower(), line_base, line_matches)
+                        break
+                    # 첫 청크에 NUL 바이트가 있으면 바이너리 파일로 보고 건너뜀
+                    if first_chunk:
+                        first_chunk = False
+                        if b'\0' in chunk:
+                            break
+                    buf = carry + chunk
+                    last_nl = buf.rfind(b'\n')
+                    if last_nl == -1:
+                        # 개행 없는 긴 청크: 통째로 스캔 후 검색어 길이만큼만 이월
+                        if self._contains_needle(buf):
+                            self._collect_line_matches(buf, buf.lower(), line_base, line_matches)
+                            carry = b''
+                        else:
+                            carry = buf[-(len(self._needle) - 1):] if len(self._needle) > 1 else b''
+                        continue
+                    head, carry = buf[:last_nl + 1], buf[last_nl + 1:]
+                    if self._contains_needle(head):
+                        self._collect_line_matches(head, head.lower(), line_base, line_matches)
+                    line_base += head.count(b'\n')
+            if line_matches:
+                match = True
+        except Exception:
+            pass
+        return match, line_matches
+
+    def run(self):
+        total = len(self.files)
+        results = [(False, [])] * total
+        # 파일별 스캔은 read() 동안 GIL을 놓으므로 스레드 풀로 병렬화
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            futures = {executor.submit(self._scan_one, full_path, file_name, st_size): i
+                       for i, (full_path, file_name, st_size) in enumerate(self.files)}
+            done_count = 0
+            # 파일마다 신호를 보내면 메인 스레드 이벤트 큐가 밀리므로 빈도 제한
+            step = max(1, total // 200)
+            last_emit_i = 0
+            last_emit_t = time.monotonic()
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception:
+                    pass
+                done_count += 1
+                now = time.monotonic()
+                if done_count - last_emit_i >= step or now - last_emit_t > 0.05 or done_count == total:
+                    last_emit_i, last_emit_t = done_count, now
+                    self.progress.emit(done_count, total)
+        self.finished.emit(results)
+
+# --------------------------- 압축 작업 Worker (멀티스레딩) ---------------------------
+# 이미 압축된 포맷: DEFLATE를 돌려도 거의 줄어들지 않으므로 저장(STORED)만 수행
+INCOMPRESSIBLE_EXTS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.webp',
+    '.mp4', '.mov', '.mkv', '.mp3', '.m4a',
+    '.zip', '.7z', '.rar', '.pdf', '.docx', '.xlsx', '.pptx',
+})
+
+class CompressionWorker(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int, int)  # (현재 완료된 파일 수, 전체 파일 수)
+    finished = QtCore.pyqtSignal(str)         # 압축 파일 경로 전달
+    error = QtCore.pyqtSignal(str)
+
+    def __init__(self, files_to_compress, zip_path):
+        super().__init__()
+        self.files_to_compress = files_to_compress  # list of tuples (full_path, arcname)
+        self.zip_path = zip_path
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    READ_CHUNK = 256 << 10  # 압축 입력을 읽는 청크 크기
+    WRITE_QUEUE_SIZE = 8    # 쓰기 대기 블롭 수 상한: 가득 차면 producer가 대기(역압)
+
+    def compress_one(self, full_path, arcname):
+        """파일 하나를 읽어 (ZipInfo, 압축된 블롭)을 만든다. zip 쓰기와 분리되어
+        여러 스레드에서 동시에 돌 수 있음. 가속 zlib이 있으면 그쪽 compressobj 사용."""
+        if self._cancelled:
+            raise Exception("압축 작업이 취소되었습니다.")
+        try:
+            # 미디어 등 이미 압축된 확장자는 STORED, 나머지는 빠른 DEFLATE(level 1)
+            deflate = os.path.splitext(arcname)[1].lower() not in INCOMPRESSIBLE_EXTS
+            zinfo = zipfile.ZipInfo.from_file(full_path, arcname)
+            zinfo.compress_type = zipfile.ZIP_DEFLATED if deflate else zipfile.ZIP_STORED
+            compressor = _zlib.compressobj(1, _zlib.DEFLATED, -15) if deflate else None
+            crc = 0
+            size = 0
+            parts = []
+            with open(full_path, 'rb') as f:
+                while True:
+                    chunk = f.read(self.READ_CHUNK)
+                    if not chunk:
+                        break
+                    crc = _zlib.crc32(chunk, crc)
+                    size += len(chunk)
+                    parts.append(compressor.compress(chunk) if deflate else chunk)
+            if deflate:
+                parts.append(compressor.flush())
+            blob = b''.join(parts)
+            zinfo.CRC = crc & 0xFFFFFFFF
+            zinfo.file_size = size
+            zinfo.compress_size = len(blob)
+            return zinfo, blob
+        except Exception as e:
+            raise Exception(f"파일 압축 실패: {full_path} - {str(e)}")
+
+    @staticmethod
+    def write_precompressed(zipf, zinfo, blob):
+        """이미 압축된 블롭을 재압축 없이 zip 멤버로 기록 (writestr의 압축 단계 생략)."""
+        zip64 = (zinfo.file_size > zipfile.ZIP64_LIMIT
+                 or zinfo.compress_size > zipfile.ZIP64_LIMIT)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(blob)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
+
+    def run(self):
+        total = len(self.files_to_compress)
+        out_q = queue.Queue(maxsize=self.WRITE_QUEUE_SIZE)
+
+        def produce(full_path, arcname):
+            out_q.put(self.compress_one(full_path, arcname))
+
+        try:
+            with zipfile.ZipFile(self.zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    futures = [executor.submit(produce, full_path, arcname)
+                               for full_path, arcname in self.files_to_compress]
+                    try:
+                        count = 0
+                        # 파일마다 신호를 보내면 메인 스레드 이벤트 큐가 밀리므로 빈도 제한
+                        step = max(1, total // 200)
+                        last_emit_i = 0
+                        last_emit_t = time.monotonic()
+                        # 이 스레드가 writer: producer들이 압축하는 동안 순차로 기록(I/O와 CPU 중첩)
+                        while count < total:
+                            if self._cancelled:
+                                raise Exception("압축 작업이 취소되었습니다.")
+                            try:
+                                zinfo, blob = out_q.get(timeout=0.1)
+                            except queue.Empty:
+                                for future in futures:
+                                    if future.done() and not future.cancelled() and future.exception() is not None:
+                                        raise future.exception()
+                                continue
+                            self.write_precompressed(zipf, zinfo, blob)
+                            count += 1
+                            now = time.monotonic()
+                            if count - last_emit_i >= step or now - last_emit_t > 0.05 or count == total:
+                                last_emit_i, last_emit_t = count, now
+                                self.progress.emit(count, total)
+                    except BaseException:
+                        # 취소/오류 시: 남은 작업을 취소하고, put에 막힌 producer가
+                        # 빠져나올 수 있도록 큐를 비워 executor 종료 대기를 푼다
+                        self._cancelled = True
+                        for future in futures:
+                            future.cancel()
+                        while not all(future.done() for future in futures):
+                            try:
+                                out_q.get_nowait()
+                            except queue.Empty:
+                                time.sleep(0.01)
+                        raise
+            self.finished.emit(self.zip_path)
+        except Exception as e:
+            self.error.emit(str(e))
+
+# --------------------------- 파일 삭제 Worker ---------------------------
+class DeletionWorker(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int, int, float, float, float)
+    finished = QtCore.pyqtSignal()
+    error = QtCore.pyqtSignal(str)
+
+    BATCH_SIZE = 500  # SHFileOperation 한 번에 넘길 파일 수
+    PROGRESS_INTERVAL = 0.1  # 진행 신호 최소 간격(초): UI 이벤트 폭주 방지
+
+    def __init__(self, files_to_delete):
+        super().__init__()
+        self.files_to_delete = files_to_delete  # list of full_path
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        total = len(self.files_to_delete)
+        start_time = time.time()
+        last_emit = 0.0
+        deleted = 0
+
+        def emit_progress():
+            nonlocal last_emit
+            now = time.monotonic()
+            if deleted < total and now - last_emit < self.PROGRESS_INTERVAL:
+                return
+            last_emit = now
+            elapsed = time.time() - start_time
+            percent = (deleted / total) * 100 if total else 100.0
+            avg = elapsed / deleted if deleted else 0
+            remaining = avg * (total - deleted)
+            self.progress.emit(deleted, total, percent, elapsed, remaining)
+
+        if _win_shell is not None:
+            # Windows: 셸 API로 배치 단위 삭제 (syscall·신호 횟수 절감, 휴지통 복구 가능)
+            flags = (_win_shellcon.FOF_SILENT | _win_shellcon.FOF_NOCONFIRMATION
+                     | _win_shellcon.FOF_NOERRORUI | _win_shellcon.FOF_ALLOWUNDO)
+            for batch_start in range(0, total, self.BATCH_SIZE):
+                if self._cancelled:
+                    break
+                batch = self.files_to_delete[batch_start:batch_start + self.BATCH_SIZE]
+                try:
+                    result = _win_shell.SHFileOperation(
+                        (0, _win_shellcon.FO_DELETE, '\0'.join(batch) + '\0\0',
+                         None, flags, None, None))[0]
+                    if result != 0:
+                        raise OSError(f"SHFileOperation 실패 (코드 {result})")
+                except Exception as e:
+                    self.error.emit(f"파일 삭제 오류: {str(e)}")
+                    return
+                deleted += len(batch)
+                emit_progress()
+        else:
+            # os.remove는 GIL을 놓고 파일당 지연이 대부분이므로 스레드 풀로 겹침
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                futures = {executor.submit(os.remove, file_path): file_path
+                           for file_path in self.files_to_delete}
+                for future in as_completed(futures):
+                    if self._cancelled:
+                        executor.shutdown(cancel_futures=True)
+                        break
+                    try:
+                        future.result()
+                    except Exception as e:
+                        executor.shutdown(cancel_futures=True)
+                        self.error.emit(f"파일 삭제 오류: {futures[future]} - {str(e)}")
+                        return
+                    deleted += 1
+                    emit_progress()
+        self.finished.emit()
+
+# --------------------------- 메인 윈도우 ---------------------------
+class MainWindow(QtWidgets.QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("카카오톡 파일 확인기")
+        self.resize(1000, 800)
+        self.setWindowIcon(QtGui.QIcon("./icon.png"))  # 프로그램 아이콘 적용
+
+        self.file_items = []  # 각 항목: (QTreeWidgetItem, full_path, base_file_name, st_size, st_mtime)
+        # 체크/숨김 상태를 파이썬 세트로 유지: 버튼 동작 시 항목 전체를
+        # PyQt 경계 너머로 다시 묻지 않아도 됨
+        self._checked_paths = set()
+        self._hidden_paths = set()
+        self._display_by_path = {}  # full_path -> 트리 표시 텍스트(압축 arcname으로 사용)
+        self._search_targets = []  # 진행중인 내용 검색의 대상 (item, full_path) 목록
+        self.active_worker = None  # 현재 진행중인 작업의 worker 참조
+
+        central_widget = QtWidgets.QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QtWidgets.QVBoxLayout(central_widget)
+
+        # 상단 툴바: GitHub, 업데이트 확인 (텍스트만 사용)
+        toolbar = QtWidgets.QToolBar()
+        self.addToolBar(QtCore.Qt.ToolBarArea.TopToolBarArea, toolbar)
+        spacer = QtWidgets.QWidget()
+        spacer.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+        toolbar.addWidget(spacer)
+        github_action = QtGui.QAction("GitHub", self)
+        github_action.triggered.connect(self.open_github)
+        toolbar.addAction(github_action)
+        update_action = QtGui.QAction("업데이트 확인", self)
+        update_action.triggered.connect(self.check_update)
+        toolbar.addAction(update_action)
+        force_update_action = QtGui.QAction("업데이트 강제 확인", self)
+        force_update_action.triggered.connect(lambda: self.check_update(force=True))
+        toolbar.addAction(force_update_action)
+
+        # 검색 바: 검색 입력, 검색 버튼, 검색 초기화
+        search_layout = QtWidgets.QHBoxLayout()
+        self.search_input = QtWidgets.QLineEdit()
+        self.search_input.setPlaceholderText("파일명 또는 파일 내용 검색")
+        self.search_input.textChanged.connect(self.filter_file_names)
+        self.search_input.returnPressed.connect(self.start_search)
+        self.search_button = QtWidgets.QPushButton("검색")
+        self.search_button.clicked.connect(self.start_search)
+        self.search_reset_button = QtWidgets.QPushButton("검색 초기화")
+        self.search_reset_button.clicked.connect(self.reset_search)
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(self.search_button)
+        search_layout.addWidget(self.search_reset_button)
+        main_layout.addLayout(search_layout)
+
+        # 진행바 및 상태 레이블 (검색/압축/삭제 진행 상황 표시)
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_bar.setVisible(False)
+        self.progress_label = QtWidgets.QLabel()
+        self.progress_label.setVisible(False)
+        main_layout.addWidget(self.progress_bar)
+        main_layout.addWidget(self.progress_label)
+
+        # 취소 버튼 (작업 진행 시 보임)
+        self.cancel_button = QtWidgets.QPushButton("취소")
+        self.cancel_button.setVisible(False)
+        self.cancel_button.clicked.connect(self.cancel_operation)
+        main_layout.addWidget(self.cancel_button)
+
+        # 파일 목록 QTreeWidget: 파일명, 확장자, 용량, 수정 날짜
+        self.tree = QtWidgets.QTreeWidget()
+        self.tree.setHeaderLabels(["파일명", "확장자", "용량", "수정 날짜"])
+        self.tree.setSortingEnabled(True)
+        self.tree.setColumnWidth(0, 400)  # 파일명 열 넓게
+        self.tree.itemDoubleClicked.connect(self.open_file)
+        self.tree.itemChanged.connect(self.on_item_changed)
+        main_layout.addWidget(self.tree)
+
+        # 하단 버튼 영역: 전체 선택, 전체 삭제, 선택 삭제, 열기, 압축하기, 새로고침
+        button_layout = QtWidgets.QHBoxLayout()
+        self.select_all_checkbox = QtWidgets.QCheckBox("전체 선택")
+        self.select_all_checkbox.stateChanged.connect(self.toggle_select_all)
+        self.btn_clear_all = QtWidgets.QPushButton("전체 삭제")
+        self.btn_clear_selected = QtWidgets.QPushButton("선택 삭제")
+        self.btn_open = QtWidgets.QPushButton("열기")
+        self.btn_compress = QtWidgets.QPushButton("압축하기")
+        self.btn_refresh = QtWidgets.QPushButton("새로고침")
+        button_layout.addWidget(self.select_all_checkbox)
+        button_layout.addWidget(self.btn_clear_all)
+        button_layout.addWidget(self.btn_clear_selected)
+        button_layout.addWidget(self.btn_open)
+        button_layout.addWidget(self.btn_compress)
+        button_layout.addWidget(self.btn_refresh)
+        button_layout.addStretch()
+        main_layout.addLayout(button_layout)
+
+        # 버튼 연결
+        self.btn_clear_all.clicked.connect(self.start_delete_all)
+        self.btn_clear_selected.clicked.connect(self.start_delete_selected)
+        self.btn_open.clicked.connect(self.open_selected_files)
+        self.btn_compress.clicked.connect(self.compress_files)
+        self.btn_refresh.clicked.connect(self.check_folder_and_list_files)
+
+        # 카카오톡 설치 및 파일 목록 로딩
+        self.check_kakaotalk_installation()
+        self.check_folder_and_list_files()
+
+    # --------------------------- 상단 액션 ---------------------------
+    def open_github(self):
+        import webbrowser
+        webbrowser.open("https://github.com/gaon12/talkcleaner")
+
+    def check_update(self, force=False):
+        """GitHub API를 통해 최신 릴리즈 버전을 확인하여 업데이트가 있으면 해당 페이지로 이동.
+        결과는 6시간 동안 디스크에 캐시하며, force=True면 캐시를 무시하고 새로 조회."""
+        import urllib.request, json, webbrowser
+        latest_version = html_url = None
+        if not force:
+            try:
+                with open(UPDATE_CACHE_PATH, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if time.time() - cached.get("ts", 0) < UPDATE_CACHE_TTL:
+                    latest_version = cached.get("latest", "")
+                    html_url = cached.get("html_url", "")
+            except Exception:
+                pass
+        if latest_version is None:
+            api_url = "https://api.github.com/repos/gaon12/talkcleaner/releases/latest"
+            try:
+                with urllib.request.urlopen(api_url, timeout=5) as response:
+                    data = json.loads(response.read().decode())
+                latest_version = data.get("tag_name", "")
+                html_url = data.get("html_url", "")
+            except Exception:
+                QtWidgets.QMessageBox.warning(self, "업데이트 확인", "업데이트 확인을 할 수 없습니다. 인터넷 연결을 확인해 주세요!")
+                return
+            try:
+                with open(UPDATE_CACHE_PATH, 'w', encoding='utf-8') as f:
+                    json.dump({"ts": time.time(), "latest": latest_version, "html_url": html_url}, f)
+            except Exception:
+                pass
+        if latest_version and latest_version != CURRENT_VERSION:
+            reply = QtWidgets.QMessageBox.question(
+                self, "업데이트 확인",
+                f"최신 버전은 {latest_version}입니다. 업데이트 페이지로 이동할까요?",
+                QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
+            )
+            if reply == QtWidgets.QMessageBox.StandardButton.Yes:
+                webbrowser.open(html_url or "")
+        else:
+            QtWidgets.QMessageBox.information(self, "업데이트 확인", "현재 최신 버전입니다.")
+
+    def check_kakaotalk_installation(self):
+        """카카오톡 설치 여부 확인 후 미설치면 경고 표시."""
+        if not kakaotalk_installed():
+            QtWidgets.QMessageBox.warning(
+                self, "카카오톡 미설치", "카카오톡이 설치되어 있지 않습니다.",
+                QtWidgets.QMessageBox.StandardButton.Ok
+            )
+
+    def check_folder_and_list_files(self):
+        """'카카오톡 받은 파일' 폴더의 파일 목록(파일명, 확장자, 용량, 수정 날짜)을 로딩."""
+        self.tree.clear()
+        self.file_items.clear()
+        self._checked_paths.clear()
+        self._hidden_paths.clear()
+        self._display_by_path.clear()
+        # tree.clear()가 항목을 파괴하므로 진행중인 내용 검색의 대상도 무효화
+        self._search_targets.clear()
+        folder_path = os.path.join(os.environ['USERPROFILE'], 'Documents', '카카오톡 받은 파일')
+        if not os.path.isdir(folder_path):
+            QtWidgets.QMessageBox.warning(
+                self, "폴더 미존재", f"폴더가 존재하지 않습니다:\n{folder_path}",
+                QtWidgets.QMessageBox.StandardButton.Ok
+            )
+            return
+        # 항목을 하나씩 붙이면 삽입마다 재정렬/리페인트가 일어나므로
+        # 갱신·정렬·시그널을 잠시 끄고 한 번에 추가
+        self.tree.setUpdatesEnabled(False)
+        self.tree.setSortingEnabled(False)
+        self.tree.blockSignals(True)
+        try:
+            items = []
+            for full_path, display_text, st in walk_files(folder_path):
+                size = st.st_size if st is not None else None
+                mod_time = st.st_mtime if st is not None else None
+                _, ext = os.path.splitext(display_text)
+                size_str = format_size(size) if size is not None else "N/A"
+                if mod_time is not None:
+                    # time.strftime은 datetime 객체 생성 없이 포맷만 수행
+                    mod_time_str = time.strftime(MOD_TIME_FMT, time.localtime(mod_time))
+                else:
+                    mod_time_str = "N/A"
+                item = QtWidgets.QTreeWidgetItem([display_text, ext, size_str, mod_time_str])
+                # 더블클릭 시 O(1) 조회를 위해 경로를 항목에 직접 저장
+                item.setData(0, QtCore.Qt.ItemDataRole.UserRole, ('file', full_path))
+                # 체크박스 추가
+                item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsUserCheckable)
+                item.setCheckState(0, QtCore.Qt.CheckState.Unchecked)
+                items.append(item)
+                self.file_items.append((item, full_path, os.path.basename(full_path), size, mod_time))
+                self._display_by_path[full_path] = display_text
+            self.tree.addTopLevelItems(items)
+        finally:
+            self.tree.setSortingEnabled(True)
+            self.tree.setUpdatesEnabled(True)
+            self.tree.blockSignals(False)
+
+    # --------------------------- 파일 열기 기능 ---------------------------
+    def open_selected_files(self):
+        """체크된 파일 열기."""
+        for item, full_path, base_name, *_ in self.file_items:
+            if item.checkState(0) == QtCore.Qt.CheckState.Checked:
+                self.open_path(full_path)
+
+    def open_file(self, item, column):
+        """파일 항목 더블클릭 시 열기.
+           자식 항목(검색 결과 줄)인 경우, 저장된 (파일경로, 줄번호) 정보를 확인하여
+           Notepad++가 설치되어 있으면 해당 줄로 이동하여 열고, 그렇지 않으면 기본 연결 프로그램으로 파일만 엽니다."""
+        data = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        if data is None:
+            return
+        if data[0] == 'file':
+            # 상위 항목: 저장된 경로로 바로 열기
+            self.open_path(data[1])
+        else:
+            # 자식 항목인 경우 (검색 결과 줄): (파일경로, 줄번호)
+            self.open_file_at_line(data[0], data[1])
+
+    def open_file_at_line(self, path, line):
+        """
+        Notepad++가 설치되어 있으면 해당 줄 번호로 열도록 시도.
+        (Notepad++가 기본 연결 프로그램이 아닐 경우에도, 특정 줄 이동을 지원하므로)
+        만약 Notepad++가 없으면 기본 연결 프로그램으로 파일만 열게 됩니다.
+        """
+        if os.name == 'nt':
+            notepadpp = r"C:\Program Files\Notepad++\notepad++.exe"
+            if os.path.exists(notepadpp):
+                try:
+                    subprocess.Popen([notepadpp, f"-n{line}", path])
+                except Exception as e:
+                    QtWidgets.QMessageBox.warning(self, "파일 열기", f"Notepad++로 열지 못했습니다:\n{str(e)}\n기본 프로그램으로 열겠습니다.")
+                    os.startfile(path)
+            else:
+                os.startfile(path)
+        else:
+            QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(path))
+
+    def open_path(self, path):
+        """운영체제 기본 프로그램으로 파일 열기."""
+        try:
+            if os.name == 'nt':
+                os.startfile(path)
+            else:
+                QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(path))
+        except Exception as e:
+            QtWidgets.QMessageBox.warning(self, "파일 열기", f"파일을 열 수 없습니다:\n{str(e)}")
+
+    # --------------------------- 전체 선택 체크박스 ---------------------------
+    def on_item_changed(self, item, column):
+        """체크 상태 변경을 세트에 반영하여 이후 버튼 동작에서 전체 스캔을 피함."""
+        data = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
+        if not data or data[0] != 'file':
+            return
+        if item.checkState(0) == QtCore.Qt.CheckState.Checked:
+            self._checked_paths.add(data[1])
+        else:
+            self._checked_paths.discard(data[1])
+
+    def toggle_select_all(self, state):
+        check_state = QtCore.Qt.CheckState.Checked if state == QtCore.Qt.CheckState.Checked else QtCore.Qt.CheckState.Unchecked
+        # setCheckState마다 itemChanged 시그널·리페인트가 발생하므로 일괄 처리 동안 차단
+        self.tree.blockSignals(True)
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for item, full_path, base_name, *_ in self.file_items:
+                item.setCheckState(0, check_state)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+            self.tree.blockSignals(False)
+            self.tree.viewport().update()
+        # 시그널을 막은 동안의 변경을 세트에 일괄 반영
+        if check_state == QtCore.Qt.CheckState.Checked:
+            self._checked_paths = set(self._display_by_path)
+        else:
+            self._checked_paths.clear()
+
+    # --------------------------- 검색 기능 ---------------------------
+    def filter_file_names(self, text):
+        """입력과 동시에 파일명으로 증분 필터링. 파일을 읽지 않으므로 즉시 반영되며,
+        내용 검색(검색 버튼)은 필터로 남은 항목에 대해서만 수행됨."""
+        needle = text.strip().lower()
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for item, full_path, base_name, *_ in self.file_items:
+                visible = not needle or needle in self._display_by_path[full_path].lower()
+                item.setHidden(not visible)
+                if visible:
+                    self._hidden_paths.discard(full_path)
+                else:
+                    self._hidden_paths.add(full_path)
+        finally:
+            self.tree.setUpdatesEnabled(True)
+
+    def start_search(self):
+        """검색어를 이용해 파일명 및 파일 내용 검색 실행.
+        파일명 필터는 이미 입력과 동시에 적용되므로 보이는 항목의 내용만 스캔."""
+        search_term = self.search_input.text().strip()
+        if search_term == "":
+            self.reset_search()
+            return
+        self._search_targets = [(item, full_path) for item, full_path, base_name, *_ in self.file_items
+                                if full_path not in self._hidden_paths]
+        files_for_search = [(full_path, base_name, st_size)
+                            for (item, full_path, base_name, st_size, st_mtime) in self.file_items
+                            if full_path not in self._hidden_paths]
+        self.search_button.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_label.setVisible(True)
+        self.cancel_button.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setMaximum(len(files_for_search))
+        self.progress_label.setText("검색 진행중...")
+        self.search_worker = SearchWorker(files_for_search, search_term)
+        self.active_worker = self.search_worker  # 현재 작업 설정
+        self.search_worker.progress.connect(self.update_progress)
+        self.search_worker.finished.connect(self.search_finished)
+        QtCore.QThreadPool.globalInstance().start(WorkerRunnable(self.search_worker.run))
+
+    def update_progress(self, value, total):
+        self.progress_bar.setValue(value)
+
+    @staticmethod
+    def highlight_matches(line_text, needle_lower):
+        """대소문자 무시 부분 일치를 <b>로 감싸 강조. 로그 내용의 HTML은 이스케이프."""
+        if not needle_lower:
+            return html.escape(line_text)
+        low = line_text.lower()
+        n = len(needle_lower)
+        parts = []
+        pos = 0
+        while True:
+            idx = low.find(needle_lower, pos)
+            if idx == -1:
+                parts.append(html.escape(line_text[pos:]))
+                break
+            parts.append(html.escape(line_text[pos:idx]))
+            parts.append(f"<b>{html.escape(line_text[idx:idx + n])}</b>")
+            pos = idx + n
+        return ''.join(parts)
+
+    def search_finished(self, results):
+        max_length = 35  # 최대 표시할 글자 수 제한
+        # 입력창은 검색 중에도 편집 가능하므로, 실제로 스캔한 검색어는 worker에서 가져옴
+        needle_lower = self.search_worker.search_term
+        # 검색 도중 새로고침되면 대상 목록이 비워져 있으므로(항목 파괴) 결과 반영을 건너뜀
+        targets = self._search_targets
+        self._search_targets = []
+        for i, (item, full_path) in enumerate(targets):
+            match, line_matches = results[i] if i < len(results) else (False, [])
+            item.takeChildren()  # 기존 자식 제거
+            item.setHidden(not match)
+            if match:
+                self._hidden_paths.discard(full_path)
+            else:
+                self._hidden_paths.add(full_path)
+            if match and line_matches:
+                for ln, line_text in line_matches:
+                    if len(line_text) > max_length:
+                        line_text = line_text[:max_length] + "..."
+                    highlighted = self.highlight_matches(line_text, needle_lower)
+                    child = QtWidgets.QTreeWidgetItem(item)
+                    child.setText(0, f"라인 {ln}: {highlighted}")
+                    child.setData(0, QtCore.Qt.ItemDataRole.UserRole, (full_path, ln))
+        self.progress_bar.setVisible(False)
+        self.progress_label.setVisible(False)
+        self.cancel_button.setVisible(False)
+        self.search_button.setEnabled(True)
+        self.active_worker = None
+
+    def reset_search(self):
+        """검색어 초기화 및 모든 파일 항목 표시, 자식 항목 제거."""
+        self.search_input.clear()
+        for item, full_path, base_name, *_ in self.file_items:
+            item.setHidden(False)
+            item.takeChildren()
+        self._hidden_paths.clear()
+
+    # --------------------------- 압축 기능 ---------------------------
+    def compress_files(self):
+        """체크된 파일이 있으면 해당 파일 압축, 없으면 전체 파일 압축 여부 확인 후 진행."""
+        checked_files = [(full_path, self._display_by_path[full_path])
+                         for full_path in self._checked_paths if full_path not in self._hidden_paths]
+        if not checked_files:
+            reply = QtWidgets.QMessageBox.question(
+                self, "압축하기", "체크된 파일이 없습니다. 전체 파일을 압축하시겠습니까?",
+                QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
+            )
+            if reply == QtWidgets.QMessageBox.StandardButton.Yes:
+                files_to_compress = [(full_path, display_text) for full_path, display_text in self._display_by_path.items()
+                                     if full_path not in self._hidden_paths]
+            else:
+                return
+        else:
+            files_to_compress = checked_files
+        if not files_to_compress:
+            QtWidgets.QMessageBox.information(self, "압축하기", "압축할 파일이 없습니다.")
+            return
+        zip_path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "압축 파일 저장",
+            os.path.join(os.environ['USERPROFILE'], 'Desktop', f"kakaotalk_file_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.zip"),
+            "Zip Files (*.zip)"
+        )
+        if not zip_path:
+            return
+        self.progress_bar.setVisible(True)
+        self.progress_label.setVisible(True)
+        self.cancel_button.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setMaximum(len(files_to_compress))
+        self.progress_label.setText("압축 진행중...")
+        self.btn_compress.setEnabled(False)
+        self.comp_worker = CompressionWorker(files_to_compress, zip_path)
+        self.active_worker = self.comp_worker  # 현재 작업 설정
+        self.comp_worker.progress.connect(self.update_progress)
+        self.comp_worker.finished.connect(self.compression_finished)
+        self.comp_worker.error.connect(self.compression_error)
+        QtCore.QThreadPool.globalInstance().start(WorkerRunnable(self.comp_worker.run))
+
+    def compression_finished(self, zip_path):
+        self.progress_bar.setVisible(False)
+        self.progress_label.setVisible(False)
+        self.cancel_button.setVisible(False)
+        self.btn_compress.setEnabled(True)
+        self.active_worker = None
+        msg_box = QtWidgets.QMessageBox(self)
+        msg_box.setWindowTitle("압축 완료")
+        msg_box.setText(f"압축이 완료되었습니다:\n{zip_path}")
+        open_button = msg_box.addButton("열기", QtWidgets.QMessageBox.ButtonRole.AcceptRole)
+        close_button = msg_box.addButton("닫기", QtWidgets.QMessageBox.ButtonRole.RejectRole)
+        msg_box.exec()
+        if msg_box.clickedButton() == open_button:
+            self.open_path(zip_path)
+
+    def compression_error(self, err_msg):
+        self.progress_bar.setVisible(False)
+        self.progress_label.setVisible(False)
+        self.cancel_button.setVisible(False)
+        self.btn_compress.setEnabled(True)
+        QtWidgets.QMessageBox.warning(self, "압축하기", f"압축 중 오류 발생:\n{err_msg}")
+        self.active_worker = None
+
+    # --------------------------- 파일 삭제 기능 ---------------------------
+    def start_delete_all(self):
+        """전체 파일 삭제 전 경고 후 실제 삭제 진행."""
+        files_to_delete = [full_path for full_path in self._display_by_path if full_path not in self._hidden_paths]
+        if not files_to_delete:
+            QtWidgets.QMessageBox.information(self, "삭제", "삭제할 파일이 없습니다.")
+            return
+        reply = QtWidgets.QMessageBox.question(
+            self, "전체 삭제", "정말로 전체 파일을 삭제하시겠습니까?\n(이 작업은 복구할 수 없습니다.)",
+            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
+        )
+        if reply != QtWidgets.QMessageBox.StandardButton.Yes:
+            return
+        self.start_deletion(files_to_delete)
+
+    def start_delete_selected(self):
+        """선택된 파일 삭제 전 경고 후 실제 삭제 진행."""
+        files_to_delete = list(self._checked_paths)
+        if not files_to_delete:
+            QtWidgets.QMessageBox.information(self, "삭제", "선택된 파일이 없습니다.")
+            return
+        reply = QtWidgets.QMessageBox.question(
+            self, "선택 삭제", "정말로 선택된 파일을 삭제하시겠습니까?\n(이 작업은 복구할 수 없습니다.)",
+            QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No
+        )
+        if reply != QtWidgets.QMessageBox.StandardButton.Yes:
+            return
+        self.start_deletion(files_to_delete)
+
+    def start_deletion(self, files_to_delete):
+        """DeletionWorker를 사용하여 파일 삭제 진행 및 진행률, 예상 시간 등을 표시."""
+        self.progress_bar.setVisible(True)
+        self.progress_label.setVisible(True)
+        self.cancel_button.setVisible(True)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setMaximum(len(files_to_delete))
+        self.progress_label.setText("삭제 진행중...")
+        self.btn_clear_all.setEnabled(False)
+        self.btn_clear_selected.setEnabled(False)
+        self.del_worker = DeletionWorker(files_to_delete)
+        self.active_worker = self.del_worker  # 현재 작업 설정
+        self.del_worker.progress.connect(self.update_deletion_progress)
+        self.del_worker.finished.connect(self.deletion_finished)
+        self.del_worker.error.connect(self.deletion_error)
+        QtCore.QThreadPool.globalInstance().start(WorkerRunnable(self.del_worker.run))
+
+    def update_deletion_progress(self, deleted, total, percent, elapsed, remaining):
+        self.progress_bar.setValue(deleted)
+        self.progress_label.setText(f"삭제: {deleted}/{total}  {percent:.1f}%\n경과: {format_time(elapsed)} / 예상남은: {format_time(remaining)}")
+
+    def deletion_finished(self):
+        self.progress_bar.setVisible(False)
+        self.progress_label.setVisible(False)
+        self.cancel_button.setVisible(False)
+        self.btn_clear_all.setEnabled(True)
+        self.btn_clear_selected.setEnabled(True)
+        self.active_worker = None
+        QtWidgets.QMessageBox.information(self, "삭제 완료", "파일 삭제가 완료되었습니다.")
+        self.check_folder_and_list_files()
+
+    def deletion_error(self, err_msg):
+        self.progress_bar.setVisible(False)
+        self.progress_label.setVisible(False)
+        self.cancel_button.setVisible(False)
+        self.btn_clear_all.setEnabled(True)
+        self.btn_clear_selected.setEnabled(True)
+        QtWidgets.QMessageBox.warning(self, "삭제 오류", err_msg)
+        self.active_worker = None
+
+    # --------------------------- 취소 버튼 기능 ---------------------------
+    def cancel_operation(self):
+        """현재 진행중인 작업 취소."""
+        if self.active_worker is not None:
+            self.active_worker.cancel()
+            QtWidgets.QMessageBox.information(self, "취소", "작업이 취소되었습니다.")
+            self.cancel_button.setVisible(False)
+
+    # --------------------------- main() ---------------------------
+    def main(self):
+        from PyQt6.QtGui import QGuiApplication
+        QGuiApplication.setHighDpiScaleFactorRoundingPolicy(QtCore.Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+        app = QtWidgets.QApplication(sys.argv)
+        app.setStyle("Fusion")
+        window = MainWindow()
+        window.show()
+        sys.exit(app.exec())
+
+def main():
+    from PyQt6.QtGui import QGuiApplication
+    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(QtCore.Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+    app = QtWidgets.QApplication(sys.argv)
+    app.setStyle("Fusion")
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())
+
+if __name__ == "__main__":
+    main()